@@ -10,7 +10,7 @@ Este módulo fornece a classe `HandCalculator`, que encapsula todas as funcional
     - Carregamento e validação dos dados de entrada (CSV ou Excel).
     - Geocodificação dos endereços utilizando o Google Maps Geocoding API com inclusão das colunas
       'Latitude', 'Longitude' e 'geometry' ao DataFrame.
-    - Conversão do DataFrame para um GeoDataFrame e, em seguida, para uma `ee.FeatureCollection` do Earth Engine.
+    - Construção direta de uma `ee.FeatureCollection` do Earth Engine a partir das coordenadas geocodificadas.
     - Amostragem dos valores HAND a partir de uma imagem pré-processada do EE.
     - Mapeamento dos valores HAND para uma descrição categórica.
     - Salvamento dos resultados finais em um arquivo CSV.
@@ -20,11 +20,9 @@ Dependências:
     - ee (Google Earth Engine Python API)
     - sys
     - time
-    - json
     - pandas
-    - geopandas
+    - numpy
     - shapely
-    - geopy
     - asyncio
     - aiohttp
     - aiolimiter
@@ -52,11 +50,13 @@ Exemplo de uso via código:
 Notas:
 ------
     - Para evitar sobrecarga no serviço de geocodificação do Google Maps, é importante monitorar o uso da API.
-    - As linhas com geocodificação malsucedida (ou seja, onde não foi possível obter coordenadas) são descartadas.
-    - A conversão para `ee.FeatureCollection` requer a conversão intermediária para GeoJSON.
+    - As linhas com geocodificação malsucedida (ou seja, onde não foi possível obter coordenadas) não são
+      enviadas ao Earth Engine e recebem MISSING_ADDRESS = True no resultado.
+    - A `ee.FeatureCollection` é construída diretamente de objetos `ee.Feature` pontuais, sem passar por
+      GeoDataFrame ou GeoJSON intermediários.
     - É necessário ter as credenciais e acesso apropriado configurado para o Google Earth Engine.
     - Para a versão assíncrona, utilizamos as bibliotecas aiohttp e aiolimiter para disparar requisições em paralelo
-      (limitadas a 1 por segundo) sem bloquear a execução.
+      (limitadas pela taxa configurada em `max_rate`) sem bloquear a execução.
 
 Licença:
 --------
@@ -76,23 +76,251 @@ load_dotenv()
 import ee
 import sys
 import time
-import json
 import csv
-from typing import Optional, List
+import re
+import queue
+import random
+import warnings
+import sqlite3
+import logging
+import logging.handlers
+import unicodedata
+from typing import Optional, Tuple
 
 import asyncio
 import aiohttp
 from aiolimiter import AsyncLimiter
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 import pandas as pd
-import geopandas as gpd
-from shapely.geometry import Point
-from geopy.geocoders import GoogleV3
+import shapely
+
+# orjson é opcional: parser JSON em C, bem mais rápido que a stdlib nos corpos de
+# resposta da geocodificação quando o volume de requisições por segundo é alto.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# pyarrow é opcional para a escrita do CSV de saída: o writer C++ multi-thread do
+# Arrow evita a formatação célula a célula em Python do DataFrame.to_csv.
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:
+    pa = None
+    pa_csv = None
 
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 if not GOOGLE_API_KEY:
     raise ValueError("A chave da API do Google Maps não foi encontrada no arquivo .env.")
 
+# Logging com escrita em thread separada (QueueHandler/QueueListener) para que as
+# mensagens não bloqueiem o caminho assíncrono com flush de stdout. Mensagens por
+# endereço ficam em DEBUG; o nível padrão INFO registra apenas as fases do fluxo.
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    _log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+    _queue_listener.start()
+    logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    logger.setLevel(logging.INFO)
+
+
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".irc_hand", "geocode_cache.sqlite")
+
+# Projetos do Earth Engine já inicializados neste processo.
+_EE_INITIALIZED: set = set()
+
+
+def ensure_ee_initialized(project_name: str) -> None:
+    """
+    Inicializa o Earth Engine para o projeto informado uma única vez por processo.
+
+    ee.Initialize é idempotente, mas não é gratuito: cada chamada refaz o refresh do
+    token OAuth e o handshake com o serviço. Este helper registra os projetos já
+    inicializados para que os vários pontos de entrada (API, CLI, HandCalculator)
+    não repitam esse custo.
+
+    Args:
+        project_name (str): Nome do projeto do Earth Engine.
+    """
+    if project_name in _EE_INITIALIZED:
+        return
+    # Endpoint de alto volume do EE: voltado a consultas programáticas em paralelo,
+    # com cota de concorrência maior que o endpoint interativo padrão.
+    ee.Initialize(project=project_name, opt_url='https://earthengine-highvolume.googleapis.com')
+    _EE_INITIALIZED.add(project_name)
+
+# A API de Geocoding do Google Maps suporta ~50 QPS por padrão; o limite antigo de
+# 1 req/s subutilizava a cota. Pode ser reduzido via parâmetro em HandCalculator.
+DEFAULT_MAX_RATE = 50
+MAX_GEOCODE_RETRIES = 5
+
+# Tamanho dos lotes enviados ao computeFeatures e número de chamadas concorrentes.
+# Lotes menores ficam abaixo dos limites por requisição do EE; as chamadas em
+# paralelo sobrepõem o cômputo no servidor com a E/S de rede.
+EE_CHUNK_SIZE = 500
+EE_MAX_WORKERS = 8
+
+# Rótulos das categorias HAND, indexados pelo valor amostrado (1 a 5) menos um.
+HAND_CATEGORIES = [
+    "Muito Baixo (> 25m)",
+    "Baixo (10-25m)",
+    "Médio (5-10m)",
+    "Alto (1-5m)",
+    "Muito Alto (< 1m)"
+]
+
+
+# Opções de leitura para os parsers do pandas que suportam thousands/decimal:
+# números em formato brasileiro são convertidos na leitura e TIV/ADDRESS são
+# preservados como texto para a normalização em _prepare_dataframe.
+READ_OPTIONS = {
+    'thousands': '.',
+    'decimal': ',',
+    'dtype': {
+        'TIV': str,
+        'ADDRESS': str
+    }
+}
+
+
+def detect_format(name: str) -> str:
+    """
+    Identifica o formato de um arquivo de dados pela extensão.
+
+    Centraliza a política de extensão usada por `load_data` e pela API, baseada em
+    `os.path.splitext` (robusto a pontos no meio do caminho ou do nome).
+
+    Args:
+        name (str): Nome ou caminho do arquivo.
+
+    Returns:
+        str: Um de "csv", "xls", "xlsx" ou "parquet".
+
+    Raises:
+        ValueError: Se a extensão não for suportada.
+    """
+    extension = os.path.splitext(name)[1].lower().lstrip('.')
+    if extension not in ("csv", "xls", "xlsx", "parquet"):
+        raise ValueError("Formato de arquivo inválido. Utilize um arquivo CSV, Excel ou Parquet.")
+    return extension
+
+
+def convert_locale_numeric(df: pd.DataFrame) -> None:
+    """
+    Converte colunas de texto com números em formato brasileiro para float.
+
+    O parser do PyArrow não suporta os parâmetros `thousands`/`decimal` do pandas;
+    este helper reproduz essa conversão após uma leitura com todas as colunas como
+    texto. Colunas (exceto TIV e ADDRESS, tratadas à parte) em que todos os valores
+    não nulos são numéricos após remover o separador de milhar '.' e trocar ','
+    por '.' são convertidas in place; as demais permanecem como texto.
+
+    Args:
+        df (pd.DataFrame): DataFrame recém-lido com colunas de texto.
+    """
+    for col in df.columns:
+        # A checagem cobre tanto o dtype object (pandas 2) quanto o dtype str
+        # padrão do pandas 3 para leituras com dtype=str.
+        if col in ('TIV', 'ADDRESS') or not (
+            pd.api.types.is_string_dtype(df[col]) or df[col].dtype == object
+        ):
+            continue
+        cleaned = df[col].str.replace('.', '', regex=False).str.replace(',', '.', regex=False)
+        converted = pd.to_numeric(cleaned, errors='coerce')
+        if (converted.isna() == df[col].isna()).all():
+            df[col] = converted
+
+
+def normalize_address(address: str) -> str:
+    """
+    Normaliza um endereço para uso como chave de cache.
+
+    A normalização remove acentos (NFKD), converte para minúsculas, remove pontuação
+    e colapsa espaços em branco consecutivos, de forma que variações triviais do mesmo
+    endereço ("Av. Paulista,100" vs "av paulista 100") compartilhem a mesma entrada.
+
+    Args:
+        address (str): Endereço original.
+
+    Returns:
+        str: Chave normalizada do endereço.
+    """
+    decomposed = unicodedata.normalize('NFKD', str(address))
+    ascii_only = decomposed.encode('ascii', 'ignore').decode('ascii')
+    without_punct = re.sub(r'[^\w\s]', ' ', ascii_only.lower())
+    return re.sub(r'\s+', ' ', without_punct).strip()
+
+
+class GeocodeCache:
+    """
+    Cache persistente de geocodificação com chave normalizada.
+
+    Os resultados são mantidos em um banco SQLite no disco e carregados integralmente
+    em um dicionário na inicialização, de forma que as consultas durante a geocodificação
+    sejam O(1) em memória. Novas entradas são gravadas imediatamente no SQLite
+    (write-through), ficando disponíveis para execuções futuras.
+
+    Attributes:
+        _conn (sqlite3.Connection): Conexão com o banco SQLite.
+        _memory (dict): Mapa em memória de chave normalizada para (latitude, longitude).
+    """
+
+    def __init__(self, cache_path: str = DEFAULT_CACHE_PATH):
+        """
+        Inicializa o cache, criando o banco e a tabela se necessário.
+
+        Args:
+            cache_path (str): Caminho do arquivo SQLite usado para persistência.
+        """
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        self._conn = sqlite3.connect(cache_path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS geocode (norm_key TEXT PRIMARY KEY, lat REAL, lon REAL, ts INTEGER)"
+        )
+        self._conn.commit()
+        self._memory = {
+            row[0]: (row[1], row[2])
+            for row in self._conn.execute("SELECT norm_key, lat, lon FROM geocode")
+        }
+
+    def get(self, address: str) -> Optional[Tuple[float, float]]:
+        """
+        Consulta o cache para um endereço.
+
+        Args:
+            address (str): Endereço original (será normalizado internamente).
+
+        Returns:
+            Optional[Tuple[float, float]]: Tupla (latitude, longitude) se houver entrada,
+            ou None em caso de miss.
+        """
+        return self._memory.get(normalize_address(address))
+
+    def put(self, address: str, lat: float, lon: float) -> None:
+        """
+        Armazena o resultado de uma geocodificação no cache em memória e no SQLite.
+
+        Args:
+            address (str): Endereço original (será normalizado internamente).
+            lat (float): Latitude obtida.
+            lon (float): Longitude obtida.
+        """
+        key = normalize_address(address)
+        self._memory[key] = (lat, lon)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO geocode (norm_key, lat, lon, ts) VALUES (?, ?, ?, ?)",
+            (key, lat, lon, int(time.time()))
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Fecha a conexão com o banco SQLite."""
+        self._conn.close()
 
 
 def get_separator(file_path: str) -> str:
@@ -106,44 +334,95 @@ def get_separator(file_path: str) -> str:
 
 
 
-async def async_geocode_address(session: aiohttp.ClientSession, address: str, limiter: AsyncLimiter):
-    if not address or str(address).lower() == 'nan':
-        print(f"[Async] Endereço inválido: {address}")
-        return address, None, None
-
-    print(f"[Async] Geocodificando: {address}")
-    async with limiter:
-        params = {
-            'address': address,
-            'key': GOOGLE_API_KEY,
-            'region': 'br',
-            'language': 'pt-BR'
-        }
-        async with session.get("https://maps.googleapis.com/maps/api/geocode/json", params=params) as response:
-            if response.status == 200:
-                data = await response.json()
-                if data.get('status') == "OK" and data.get('results'):
-                    location = data['results'][0]['geometry']['location']
-                    lat = float(location['lat'])
-                    lon = float(location['lng'])
-                    print(f"[Async] Endereço encontrado: {address} -> ({lat}, {lon})")
-                    return address, lat, lon
-    print(f"[Async] Não foi possível encontrar: {address}")
+async def async_geocode_address(session: aiohttp.ClientSession, address: str, limiter: AsyncLimiter,
+                                cache: Optional[GeocodeCache] = None):
+    # Endereços inválidos (vazios/NaN) são filtrados pelo chamador em
+    # geocode_all_addresses, antes da criação das corrotinas; aqui o endereço
+    # já chega válido.
+    if cache is not None:
+        cached = cache.get(address)
+        if cached is not None:
+            logger.debug(f"[Async] Cache hit: {address} -> {cached}")
+            return address, cached[0], cached[1]
+
+    logger.debug(f"[Async] Geocodificando: {address}")
+    params = {
+        'address': address,
+        'key': GOOGLE_API_KEY,
+        'region': 'br',
+        'language': 'pt-BR'
+    }
+    for attempt in range(MAX_GEOCODE_RETRIES):
+        async with limiter:
+            async with session.get("https://maps.googleapis.com/maps/api/geocode/json", params=params) as response:
+                if response.status == 429:
+                    await asyncio.sleep(2 ** attempt * 0.5 + random.random())
+                    continue
+                if response.status == 200:
+                    data = await response.json(loads=json_loads, content_type=None)
+                    status = data.get('status')
+                    if status == "OVER_QUERY_LIMIT":
+                        await asyncio.sleep(2 ** attempt * 0.5 + random.random())
+                        continue
+                    if status == "OK" and data.get('results'):
+                        location = data['results'][0]['geometry']['location']
+                        lat = float(location['lat'])
+                        lon = float(location['lng'])
+                        if cache is not None:
+                            cache.put(address, lat, lon)
+                        logger.debug(f"[Async] Endereço encontrado: {address} -> ({lat}, {lon})")
+                        return address, lat, lon
+                break
+    logger.debug(f"[Async] Não foi possível encontrar: {address}")
     return address, None, None
 
 
 
-async def geocode_all_addresses(addresses: list) -> list:
+async def geocode_all_addresses(addresses: list, max_rate: int = DEFAULT_MAX_RATE,
+                                session: Optional[aiohttp.ClientSession] = None,
+                                cache_path: str = DEFAULT_CACHE_PATH) -> list:
     """
-    Cria uma sessão aiohttp e dispara tarefas assíncronas para todos os endereços.
-    Utiliza um rate limiter para não exceder 1 requisição por segundo.
+    Dispara tarefas assíncronas de geocodificação para os endereços únicos.
+    Endereços duplicados são geocodificados uma única vez e o resultado é replicado
+    para todas as linhas correspondentes, reduzindo as requisições HTTP de O(linhas)
+    para O(únicos). Utiliza um rate limiter para não exceder `max_rate` requisições
+    por segundo e um cache persistente (`GeocodeCache`) para que endereços já vistos
+    em execuções anteriores não consumam requisições nem o limite de taxa.
+
+    Se `session` for fornecida, ela é reutilizada (mantendo as conexões TCP/TLS
+    abertas entre chamadas) e não é fechada aqui; caso contrário uma sessão
+    temporária é criada e encerrada ao final.
     """
-    print(f"[Async] Iniciando geocodificação assíncrona para {len(addresses)} endereços...")
-    limiter = AsyncLimiter(max_rate=1, time_period=1)
-    async with aiohttp.ClientSession() as session:
-        tasks = [async_geocode_address(session, address, limiter) for address in addresses]
-        results = await asyncio.gather(*tasks)
-    print("[Async] Geocodificação assíncrona concluída.")
+    logger.info(f"[Async] Iniciando geocodificação assíncrona para {len(addresses)} endereços...")
+    unique_addresses = list(dict.fromkeys(
+        address for address in addresses if address and str(address).lower() != 'nan'
+    ))
+    logger.info(f"[Async] {len(unique_addresses)} endereços únicos a geocodificar.")
+
+    cache = GeocodeCache(cache_path)
+    limiter = AsyncLimiter(max_rate=max_rate, time_period=1)
+    owns_session = session is None
+    if owns_session:
+        session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit_per_host=20))
+    try:
+        tasks = [async_geocode_address(session, address, limiter, cache) for address in unique_addresses]
+        unique_results = await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        if owns_session:
+            await session.close()
+        cache.close()
+
+    # Uma exceção em um endereço não derruba o lote inteiro: a linha correspondente
+    # fica sem coordenadas (MISSING_ADDRESS=True) e o erro é registrado no log.
+    mapping = {}
+    for address, result in zip(unique_addresses, unique_results):
+        if isinstance(result, BaseException):
+            logger.warning(f"[Async] Falha ao geocodificar '{address}': {result}")
+            mapping[address] = (None, None)
+        else:
+            mapping[address] = (result[1], result[2])
+    results = [(address, *mapping.get(address, (None, None))) for address in addresses]
+    logger.info("[Async] Geocodificação assíncrona concluída.")
     return results
 
 
@@ -154,9 +433,10 @@ class HandCalculator:
     Esta classe realiza os seguintes passos:
       1. Carregamento dos dados de um arquivo CSV ou Excel.
       2. Geocodificação dos endereços, com a criação das colunas 'Latitude', 'Longitude'
-         e 'geometry'. As linhas sem sucesso na geocodificação são descartadas.
-      3. Conversão dos dados geocodificados para um GeoDataFrame e, em seguida, para uma
-         `ee.FeatureCollection` do Google Earth Engine.
+         e 'geometry'. As linhas sem sucesso na geocodificação são marcadas com
+         MISSING_ADDRESS = True.
+      3. Construção direta de uma `ee.FeatureCollection` do Google Earth Engine com um
+         `ee.Feature` pontual por linha geocodificada.
       4. Amostragem dos valores HAND a partir de uma imagem predefinida do EE.
       5. Mapeamento dos valores HAND para uma descrição categórica.
       6. Salvamento dos resultados em um arquivo CSV.
@@ -166,151 +446,183 @@ class HandCalculator:
         _df (Optional[pd.DataFrame]): DataFrame com os dados carregados, após a leitura do arquivo.
     """
 
-    def __init__(self, project_name: Optional[str] = None):
+    def __init__(self, project_name: Optional[str] = None, max_rate: int = DEFAULT_MAX_RATE,
+                 verbose: bool = False, cache_path: str = DEFAULT_CACHE_PATH):
         """
-        Inicializa a instância com o nome do projeto do Earth Engine e inicializa o EE.
+        Inicializa a instância com o nome do projeto do Earth Engine.
+
+        A inicialização do EE em si é adiada para o primeiro uso (ver
+        `ensure_initialized`), de forma que construir a instância é barato.
 
         Args:
             project_name (str): Nome do projeto do Earth Engine a ser utilizado.
-
-        Raises:
-            Exception: Se ocorrer erro durante a inicialização do Earth Engine.
+            max_rate (int, opcional): Máximo de requisições de geocodificação por segundo.
+                                      Padrão é DEFAULT_MAX_RATE.
+            verbose (bool, opcional): Se True, habilita as mensagens de log por endereço
+                                      (nível DEBUG). Padrão é False.
+            cache_path (str, opcional): Caminho do arquivo SQLite do cache de geocodificação.
+                                        Padrão é DEFAULT_CACHE_PATH.
         """
-        print("[Init] Inicializando Google Earth Engine...")
-        
-        if project_name:
-            self._project_name = project_name
-            ee.Initialize(project=project_name)
+        self.verbose = verbose
+        if verbose:
+            logger.setLevel(logging.DEBUG)
 
+        # A inicialização do Earth Engine é adiada para o primeiro uso (ver
+        # ensure_initialized), de forma que construir a instância seja instantâneo.
+        self._project_name = project_name
+
+        self._max_rate = max_rate
+        self._cache_path = cache_path
         self._df: Optional[pd.DataFrame] = None
-        print("[Init] Google Earth Engine inicializado com sucesso.")
+        self._features: Optional[list] = None
+        self._hand_image: Optional[ee.Image] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+    def ensure_initialized(self) -> None:
+        """
+        Garante que o Earth Engine esteja inicializado para o projeto da instância.
+
+        Chamado de forma lazy pelos métodos que dependem do EE; após a primeira
+        inicialização o custo é apenas uma consulta a um set em memória.
+        """
+        if self._project_name:
+            ensure_ee_initialized(self._project_name)
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Retorna o event loop da instância, criando-o na primeira utilização."""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop
+
+    async def _geocode_addresses(self, addresses: list) -> list:
+        """
+        Geocodifica os endereços reutilizando a sessão HTTP persistente da instância.
+
+        A sessão aiohttp é criada de forma lazy na primeira chamada e mantida aberta
+        entre invocações, preservando as conexões TCP/TLS com o serviço de
+        geocodificação em chamadas subsequentes de `run()`.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit_per_host=20))
+        return await geocode_all_addresses(addresses, max_rate=self._max_rate,
+                                           session=self._session, cache_path=self._cache_path)
+
+    def close(self) -> None:
+        """
+        Encerra a sessão HTTP persistente e o event loop da instância.
+
+        Deve ser chamado quando a instância não for mais utilizada; é seguro chamar
+        mais de uma vez.
+        """
+        if self._loop is not None and not self._loop.is_closed():
+            if self._session is not None and not self._session.closed:
+                self._loop.run_until_complete(self._session.close())
+            self._loop.close()
+        self._session = None
+        self._loop = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
 
     def load_data(self, file_path: str) -> None:
         """
-        Carrega os dados de um arquivo CSV ou Excel.
+        Carrega os dados de um arquivo CSV, Excel ou Parquet.
 
         Este método identifica o formato do arquivo com base na sua extensão e carrega os dados
-        para o atributo interno `_df`.
+        para o atributo interno `_df`. Entradas pré-processadas em Parquet são lidas pelo
+        caminho colunar do PyArrow, bem mais rápido que o parse de CSV para execuções repetidas.
 
         Args:
             file_path (str): Caminho do arquivo de entrada.
 
         Raises:
-            ValueError: Se o formato do arquivo não for CSV, XLS ou XLSX.
+            ValueError: Se o formato do arquivo não for CSV, XLS, XLSX ou Parquet.
         """
-        print(f"[Load Data] Carregando dados do arquivo: {file_path}")
-        extension = file_path.split('.')[-1].lower()
-        
-        read_options = {
-            'thousands': '.', 
-            'decimal': ',',    
-            'dtype': {
-                'TIV': str,    
-                'ADDRESS': str 
-            }
-        }
-        
+        logger.info(f"[Load Data] Carregando dados do arquivo: {file_path}")
+
         try:
-            if extension == "csv":
-                self._df = pd.read_csv(file_path, **read_options)
-            elif extension in ["xls", "xlsx"]:
-                self._df = pd.read_excel(file_path, **read_options)
-            else:
-                raise ValueError("Formato de arquivo inválido. Utilize um arquivo CSV ou Excel.")
-            
-            def clean_and_convert_tiv(value):
-                if pd.isna(value):
-                    return 0.0
-                
-                import re
-                match = re.search(r'([\d.,]+)', str(value))
-                if match:
-                    value = match.group(1)
-                
-                value = value.replace('.', '').replace(',', '.')
-                
+            extension = detect_format(file_path)
+
+            if extension == "parquet":
+                df = pd.read_parquet(file_path, engine='pyarrow')
+            elif extension == "csv":
                 try:
-                    return float(value)
-                except ValueError:
-                    print(f"[Aviso] Não foi possível converter o valor: {value}")
-                    return 0.0
-            
-            self._df['TIV'] = self._df['TIV'].apply(clean_and_convert_tiv)
-            
-            cols_para_remover = [col for col in self._df.columns if col.upper().startswith('LAT') or col.upper().startswith('LON') or col.upper().startswith("CATEGORIA_HAND")]
-            self._df.drop(columns=cols_para_remover, inplace=True)
-            
-            self._df["id"] = self._df.index
-            
-            print(f"[Load Data] Dados carregados com sucesso. Total de registros: {len(self._df)}")
-            
-            print("[Load Data] Primeiros valores de TIV:")
-            print(self._df['TIV'].head())
-        
+                    # Parser multi-thread do Arrow. Ele não suporta thousands/decimal,
+                    # então todas as colunas são lidas como texto e os números em
+                    # formato brasileiro são convertidos por convert_locale_numeric.
+                    df = pd.read_csv(file_path, engine='pyarrow', dtype=str)
+                    convert_locale_numeric(df)
+                except (ImportError, ValueError):
+                    df = pd.read_csv(file_path, **READ_OPTIONS)
+            else:
+                df = pd.read_excel(file_path, **READ_OPTIONS)
+
+            self._prepare_dataframe(df)
+
         except Exception as e:
-            print(f"[Erro] Falha ao carregar dados: {e}")
+            logger.error(f"[Erro] Falha ao carregar dados: {e}")
             raise
-        
-    def collect_coordinates(self, address_column: str) -> ee.FeatureCollection:
-        """
-        Realiza a geocodificação dos endereços de forma síncrona e retorna uma FeatureCollection do Earth Engine.
 
-        Para cada endereço presente na coluna especificada, o método utiliza o serviço de geocodificação
-        do Google Maps (via GoogleV3) para obter latitude e longitude. Além disso, ele adiciona três novas colunas ao DataFrame:
-          - 'Latitude': Latitude obtida.
-          - 'Longitude': Longitude obtida.
-          - 'geometry': Objeto Point (do shapely) formado a partir das coordenadas.
+    def load_dataframe(self, df: pd.DataFrame) -> None:
+        """
+        Carrega os dados a partir de um DataFrame já em memória.
 
-        As linhas com falha na geocodificação (resultando em None) são descartadas posteriormente.
+        Alternativa a `load_data` para chamadores (como a API) que já leram e validaram
+        o arquivo de entrada, evitando uma releitura do disco. O DataFrame é copiado
+        antes da normalização para não alterar o objeto do chamador.
 
         Args:
-            address_column (str): Nome da coluna que contém os endereços.
-
-        Returns:
-            ee.FeatureCollection: Coleção de features do Earth Engine contendo a geometria dos pontos.
+            df (pd.DataFrame): DataFrame com os dados de entrada.
+        """
+        logger.info(f"[Load Data] Carregando dados de DataFrame em memória ({len(df)} registros)")
+        self._prepare_dataframe(df.copy())
 
-        Raises:
-            ValueError: Se os dados não tiverem sido carregados previamente com `load_data()`.
+    def _prepare_dataframe(self, df: pd.DataFrame) -> None:
         """
-        if self._df is None:
-            raise ValueError("Dados não carregados. Chame o método load_data primeiro.")
+        Normaliza o DataFrame de entrada e o armazena em `_df`.
 
-        print("[Async] Iniciando geocodificação assíncrona...")
-        addresses = list(self._df[address_column])
-        results = asyncio.run(geocode_all_addresses(addresses))
-
-        latitudes: List[Optional[float]] = []
-        longitudes: List[Optional[float]] = []
-        geometries: List[Optional[Point]] = []
-        missing_addresses: List[bool] = []  # Lista para armazenar o status booleano da geocodificação
-
-        for index, (address, lat, lon) in enumerate(results, start=1):
-            print(f"[Async] Processando ({index}/{len(results)}): {address}")
-            latitudes.append(lat)
-            longitudes.append(lon)
-            if lat is not None and lon is not None:
-                geometries.append(Point(lon, lat))
-                missing_addresses.append(False)  # Geocodificação bem-sucedida
-            else:
-                geometries.append(None)
-                missing_addresses.append(True)   # Geocodificação falhou
+        A normalização converte a coluna TIV para float (tratando separadores de
+        milhar/decimal e texto anexo) e remove colunas derivadas de execuções
+        anteriores (LAT*, LON*, CATEGORIA_HAND*).
 
-        self._df["Latitude"] = latitudes
-        self._df["Longitude"] = longitudes
-        self._df["geometry"] = geometries
-        self._df["MISSING_ADDRESS"] = missing_addresses  # Coluna agora com valores booleanos
+        Args:
+            df (pd.DataFrame): DataFrame recém-carregado.
+        """
+        def clean_and_convert_tiv(value):
+            if pd.isna(value):
+                return 0.0
+
+            match = re.search(r'([\d.,]+)', str(value))
+            if match:
+                value = match.group(1)
+
+            value = value.replace('.', '').replace(',', '.')
+
+            try:
+                return float(value)
+            except ValueError:
+                logger.warning(f"[Aviso] Não foi possível converter o valor: {value}")
+                return 0.0
+
+        if pd.api.types.is_numeric_dtype(df['TIV']):
+            # Entradas tipadas (ex.: Parquet) já trazem o TIV numérico; a limpeza
+            # textual acima corromperia o valor (1500.5 -> '15005').
+            df['TIV'] = df['TIV'].fillna(0.0).astype(float)
+        else:
+            df['TIV'] = df['TIV'].apply(clean_and_convert_tiv)
 
-        print("[Async] Conversão para GeoDataFrame...")
-        # Cria o GeoDataFrame completo...
-        gdf = gpd.GeoDataFrame(self._df, crs="EPSG:4326")
-        # E filtra apenas os registros com geometria válida para enviar ao Earth Engine:
-        gdf_valid = gdf[gdf["geometry"].notnull()]
-        geojson = json.loads(gdf_valid.to_json())
-        feature_collection = ee.FeatureCollection(geojson)
-        print("[Async] Geocodificação assíncrona concluída.")
+        cols_para_remover = [col for col in df.columns if col.upper().startswith('LAT') or col.upper().startswith('LON') or col.upper().startswith("CATEGORIA_HAND")]
+        df.drop(columns=cols_para_remover, inplace=True)
 
-        return feature_collection
+        self._df = df
 
+        logger.info(f"[Load Data] Dados carregados com sucesso. Total de registros: {len(self._df)}")
+
+        logger.debug("[Load Data] Primeiros valores de TIV:\n%s", self._df['TIV'].head())
+        
     def collect_coordinates_async(self, address_column: str) -> ee.FeatureCollection:
         """
         Realiza a geocodificação dos endereços de forma assíncrona e retorna uma FeatureCollection do Earth Engine.
@@ -323,7 +635,7 @@ class HandCalculator:
         - 'geometry': Objeto Point (do shapely) formado a partir das coordenadas.
         - 'MISSING_ADDRESS': Booleano que indica True se a geocodificação falhar ou False caso contrário.
 
-        As linhas com falha na geocodificação (resultando em None) serão descartadas na conversão para GeoDataFrame,
+        As linhas com falha na geocodificação (resultando em None) não são enviadas ao Earth Engine,
         mas a coluna "MISSING_ADDRESS" ficará disponível no DataFrame final.
 
         Args:
@@ -338,37 +650,54 @@ class HandCalculator:
         if self._df is None:
             raise ValueError("Dados não carregados. Chame o método load_data primeiro.")
 
-        print("[Async] Iniciando geocodificação assíncrona...")
+        self.ensure_initialized()
+        logger.info("[Async] Iniciando geocodificação assíncrona...")
         addresses = list(self._df[address_column])
-        results = asyncio.run(geocode_all_addresses(addresses))
-
-        latitudes: List[Optional[float]] = []
-        longitudes: List[Optional[float]] = []
-        geometries: List[Optional[Point]] = []
-        missing_addresses: List[bool] = []  # Lista para armazenar o status booleano da geocodificação
-
-        for index, (address, lat, lon) in enumerate(results, start=1):
-            print(f"[Async] Processando ({index}/{len(results)}): {address}")
-            latitudes.append(lat)
-            longitudes.append(lon)
-            if lat is not None and lon is not None:
-                geometries.append(Point(lon, lat))
-                missing_addresses.append(False)  # Geocodificação bem-sucedida
-            else:
-                geometries.append(None)
-                missing_addresses.append(True)   # Geocodificação falhou
+        results = self._ensure_loop().run_until_complete(self._geocode_addresses(addresses))
+
+        # Montagem vetorizada das colunas: os resultados viram arrays contíguos e a
+        # coluna de geometria é construída em uma única chamada à API C do GEOS
+        # (shapely.points), sem criar objetos Point linha a linha em Python.
+        if results:
+            arr = np.array(results, dtype=object)
+            latitudes = pd.to_numeric(arr[:, 1], errors='coerce')
+            longitudes = pd.to_numeric(arr[:, 2], errors='coerce')
+        else:
+            # Entrada sem linhas (ex.: CSV só com cabeçalho): o array 2-D acima não
+            # pode ser indexado, mas o restante do fluxo funciona com arrays vazios.
+            latitudes = np.array([], dtype=float)
+            longitudes = np.array([], dtype=float)
+        missing_mask = np.isnan(latitudes)
+
+        geometries = shapely.points(longitudes, latitudes)
+        geometries[missing_mask] = None
 
         self._df["Latitude"] = latitudes
         self._df["Longitude"] = longitudes
         self._df["geometry"] = geometries
-        self._df["MISSING_ADDRESS"] = missing_addresses  # Coluna agora com valores booleanos
-
-        print("[Async] Conversão para GeoDataFrame...")
-        gdf = gpd.GeoDataFrame(self._df, crs="EPSG:4326")
-        gdf = gdf.dropna(subset=["geometry"])
-        geojson = json.loads(gdf.to_json())
-        feature_collection = ee.FeatureCollection(geojson)
-        print("[Async] Geocodificação assíncrona concluída.")
+        self._df["MISSING_ADDRESS"] = missing_mask
+
+        # Constrói as features do Earth Engine diretamente a partir dos arrays de
+        # coordenadas, evitando o ciclo gdf.to_json() -> json.loads() que serializa
+        # e desserializa o dataset inteiro apenas para conversão de formato.
+        logger.info("[Async] Montando FeatureCollection do Earth Engine...")
+        valid = self._df.loc[~missing_mask]
+        # Apenas a geometria e o índice posicional da linha (propriedade 'id') viajam
+        # para o Earth Engine: as demais colunas permanecem locais e são reunidas ao
+        # resultado pelo índice em calculate_hand_values. Isso encolhe o payload
+        # proporcionalmente ao número de colunas extras e permite realinhar os
+        # resultados mesmo que o sampleRegions descarte pontos sem cobertura.
+        features = [
+            ee.Feature(ee.Geometry.Point([lon, lat]), {"id": int(row_index)})
+            for row_index, lon, lat in zip(
+                valid.index, valid["Longitude"].to_numpy(), valid["Latitude"].to_numpy()
+            )
+        ]
+        # A lista de features fica disponível para que calculate_hand_values possa
+        # montar lotes client-side sem reenviar a coleção completa a cada requisição.
+        self._features = features
+        feature_collection = ee.FeatureCollection(features)
+        logger.info("[Async] Geocodificação assíncrona concluída.")
 
         return feature_collection
 
@@ -395,32 +724,66 @@ class HandCalculator:
         Returns:
             pd.DataFrame: DataFrame contendo os resultados amostrados e formatados.
         """
-        print("[HAND] Iniciando amostragem dos valores HAND...")
-        hand_image = ee.Image("projects/ee-irc/assets/risco_hand_brasil")
-        points_hand = hand_image.sampleRegions(collection=points)
-
-        points_df = ee.data.computeFeatures({
-            "expression": points_hand,
-            "fileFormat": "PANDAS_DATAFRAME"
-        })
+        self.ensure_initialized()
+        logger.info("[HAND] Iniciando amostragem dos valores HAND...")
+        # O handle da imagem é reaproveitado entre chamadas de run() na mesma
+        # instância, evitando reconstruir o nó do grafo e a consulta de metadados.
+        if self._hand_image is None:
+            self._hand_image = ee.Image("projects/ee-irc/assets/risco_hand_brasil")
+        hand_image = self._hand_image
+
+        def sample_chunk(chunk: ee.FeatureCollection) -> pd.DataFrame:
+            return ee.data.computeFeatures({
+                "expression": hand_image.sampleRegions(collection=chunk),
+                "fileFormat": "PANDAS_DATAFRAME"
+            })
+
+        # Divide os pontos em lotes e dispara as chamadas computeFeatures em paralelo,
+        # em vez de uma única requisição bloqueante sujeita ao teto de tempo do EE.
+        ids = self._df.index.tolist()
+        if self._features is not None and len(self._features) == 0:
+            # Nenhum endereço geocodificado com sucesso (ex.: geocodificador
+            # indisponível): não há o que amostrar, então o Earth Engine não é
+            # chamado e todas as linhas saem com categoria_hand nula.
+            logger.warning("[HAND] Nenhum ponto geocodificado com sucesso; amostragem ignorada.")
+            points_df = pd.DataFrame({'id': [], 'geo': [], 'b1': []})
+        elif len(ids) > EE_CHUNK_SIZE:
+            if self._features is not None:
+                # Lotes montados client-side a partir da lista de features: cada
+                # requisição carrega apenas os próprios pontos, e não a coleção
+                # inteira acompanhada de um filtro.
+                chunks = [
+                    ee.FeatureCollection(self._features[i:i + EE_CHUNK_SIZE])
+                    for i in range(0, len(self._features), EE_CHUNK_SIZE)
+                ]
+            else:
+                chunks = [
+                    points.filter(ee.Filter.inList('id', ids[i:i + EE_CHUNK_SIZE]))
+                    for i in range(0, len(ids), EE_CHUNK_SIZE)
+                ]
+            logger.info(f"[HAND] Amostrando em {len(chunks)} lotes de até {EE_CHUNK_SIZE} pontos...")
+            with ThreadPoolExecutor(max_workers=EE_MAX_WORKERS) as executor:
+                chunk_dfs = list(executor.map(sample_chunk, chunks))
+            points_df = pd.concat(chunk_dfs, ignore_index=True)
+        else:
+            points_df = sample_chunk(points)
 
+        # Constrói a coluna como Categorical a partir dos códigos amostrados: os rótulos
+        # ficam armazenados uma única vez e a coluna vira um array de códigos int8, em vez
+        # de N strings duplicadas em dtype object.
+        codes = (points_df["b1"].astype("Int8") - 1).fillna(-1).astype("int8")
         formatted_df = (
             points_df
-            .drop("geo", axis=1)
-            .rename(columns={"b1": "categoria_hand"})
-            .assign(
-                categoria_hand=lambda df: df.categoria_hand.map({
-                    1: "Muito Baixo (> 25m)",
-                    2: "Baixo (10-25m)",
-                    3: "Médio (5-10m)",
-                    4: "Alto (1-5m)",
-                    5: "Muito Alto (< 1m)"
-                })
-            )
+            .drop(columns=["geo", "b1"])
+            .assign(categoria_hand=pd.Categorical.from_codes(codes, categories=HAND_CATEGORIES))
         )
-        print("[HAND] Amostragem e mapeamento dos valores HAND concluídos.")
+        logger.info("[HAND] Amostragem e mapeamento dos valores HAND concluídos.")
 
-        final_df = self._df.merge(formatted_df[['id', 'categoria_hand']], on='id', how='left')
+        # Alinha as categorias pelo índice posicional da linha (propriedade 'id' das
+        # features) em vez de um merge (hash join): o reindex é O(N) e não constrói
+        # tabelas hash nem DataFrame intermediário.
+        categoria = formatted_df.set_index('id')['categoria_hand'].reindex(self._df.index)
+        final_df = self._df.assign(categoria_hand=categoria.array)
         
         if 'DM' not in final_df.columns:
             final_df['DM'] = final_df['TIV']
@@ -462,7 +825,9 @@ class HandCalculator:
         Salva os resultados finais em um arquivo CSV.
 
         Este método recebe um DataFrame contendo os resultados do processamento e o salva no
-        caminho especificado pelo parâmetro `output_path`.
+        caminho especificado pelo parâmetro `output_path`. Quando o pyarrow está disponível,
+        a serialização usa o writer C++ multi-thread do Arrow; caso contrário, a escrita cai
+        no `to_csv` do pandas em blocos de 50 mil linhas para limitar o pico de memória.
 
         Args:
             df (pd.DataFrame): DataFrame com os resultados finais.
@@ -471,16 +836,28 @@ class HandCalculator:
         Exemplo:
             >>> calculator.save_results(result_df, "saida/resultados.csv")
         """
-        print(f"[Save] Salvando resultados em: {output_path}")
-        df.to_csv(output_path, index=False)
-        print("[Save] Resultados salvos com sucesso.")
+        logger.info(f"[Save] Salvando resultados em: {output_path}")
+        if pa_csv is not None:
+            # O writer do Arrow serializa booleanos como true/false; colunas como
+            # MISSING_ADDRESS são convertidas para texto antes da escrita para
+            # manter o formato True/False do to_csv lido pelo HandReportGenerator.
+            bool_cols = df.select_dtypes(include='bool').columns
+            if len(bool_cols) > 0:
+                df = df.copy()
+                for col in bool_cols:
+                    df[col] = df[col].map({True: 'True', False: 'False'})
+            pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), output_path)
+        else:
+            df.to_csv(output_path, index=False, chunksize=50_000)
+        logger.info("[Save] Resultados salvos com sucesso.")
 
-    def run(self, file_path: str, address_column: str, output_path: str, use_async: bool = True) -> None:
+    def run(self, file_path: str, address_column: str, output_path: str, use_async: bool = True,
+            df: Optional[pd.DataFrame] = None) -> None:
         """
         Executa o fluxo completo de processamento dos dados.
 
         Esse método integra todas as etapas:
-            1. Carrega os dados do arquivo informado.
+            1. Carrega os dados do arquivo informado (ou de um DataFrame já em memória).
             2. Geocodifica os endereços a partir da coluna especificada.
             3. Calcula os valores HAND utilizando o Earth Engine.
             4. Salva os resultados no arquivo CSV definido.
@@ -489,18 +866,26 @@ class HandCalculator:
             file_path (str): Caminho do arquivo de entrada (CSV ou Excel).
             address_column (str): Nome da coluna que contém os endereços para geocodificação.
             output_path (str): Caminho para salvar o arquivo CSV de saída.
-            use_async (bool, opcional): Define se a geocodificação será feita de forma assíncrona.
-                                        Padrão é True.
+            use_async (bool, opcional): Obsoleto e ignorado; a geocodificação é sempre
+                                        assíncrona. Mantido apenas por compatibilidade.
+            df (pd.DataFrame, opcional): DataFrame já carregado. Se fornecido, é usado no
+                                         lugar da leitura de `file_path`.
         """
-        print("[Run] Iniciando processamento completo...")
-        self.load_data(file_path)
-        if use_async:
-            points = self.collect_coordinates_async(address_column)
+        if use_async is not True:
+            warnings.warn(
+                "O parâmetro use_async está obsoleto e é ignorado; a geocodificação é sempre assíncrona.",
+                DeprecationWarning,
+                stacklevel=2
+            )
+        logger.info("[Run] Iniciando processamento completo...")
+        if df is not None:
+            self.load_dataframe(df)
         else:
-            points = self.collect_coordinates(address_column)
+            self.load_data(file_path)
+        points = self.collect_coordinates_async(address_column)
         result_df = self.calculate_hand_values(points)
         self.save_results(result_df, output_path)
-        print("[Run] Processamento concluído com sucesso.")
+        logger.info("[Run] Processamento concluído com sucesso.")
 
     @classmethod
     def run_from_cli(cls) -> None:
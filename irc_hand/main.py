@@ -1,19 +1,21 @@
 import uvicorn
-import ee
 from fastapi import FastAPI
+from hand_application import ensure_ee_initialized
 from src.routes import hand_route
 
-try:
-    ee.Initialize(project="ee-irc")
-except Exception as e:
-    print(f"Erro na inicialização do Earth Engine: {e}")
-
 app = FastAPI(
     title="HAND Report Generator API",
     description="API para processamento de relatórios HAND",
     version="0.1.0"
 )
 
+@app.on_event("startup")
+async def initialize_earth_engine():
+    try:
+        ensure_ee_initialized("ee-irc")
+    except Exception as e:
+        print(f"Erro na inicialização do Earth Engine: {e}")
+
 app.include_router(hand_route.router, prefix="/api/hand")
 
 @app.get("/")
@@ -5,6 +5,7 @@ from fastapi import APIRouter, File, UploadFile, HTTPException
 from fastapi.responses import FileResponse
 import pandas as pd
 
+from hand_application import READ_OPTIONS, convert_locale_numeric, detect_format
 from src.services.hand_processor import process_hand_report
 
 router = APIRouter()
@@ -20,34 +21,52 @@ async def upload_hand_file(file: UploadFile = File(...)):
     Returns:
         Dict: Informações sobre os arquivos gerados
     """
-    filename = file.filename.lower()
-    if not filename.endswith(('.csv', '.xlsx', '.xls')):
+    try:
+        file_format = detect_format(file.filename)
+    except ValueError:
+        file_format = None
+    if file_format not in ("csv", "xlsx", "xls"):
         raise HTTPException(status_code=400, detail="Formato de arquivo inválido. Use CSV ou Excel.")
     
     unique_id = str(uuid.uuid4())
     temp_dir = "/tmp/hand_processing"
     os.makedirs(temp_dir, exist_ok=True)
     
+    # Nome lógico usado apenas para derivar os nomes dos arquivos de saída;
+    # o upload em si não é gravado em disco.
     input_path = os.path.join(temp_dir, f"{unique_id}_{file.filename}")
-    
+
     try:
-        with open(input_path, "wb") as buffer:
-            buffer.write(await file.read())
-        
         try:
-            df = pd.read_csv(input_path) if input_path.endswith('.csv') else pd.read_excel(input_path)
+            # Parse direto do arquivo spooled do upload: o conteúdo não é
+            # materializado em um objeto bytes nem copiado para o disco — o
+            # DataFrame validado segue sozinho para o processamento.
+            if file_format == 'csv':
+                try:
+                    # Mesmo parser multi-thread usado em HandCalculator.load_data:
+                    # colunas lidas como texto e números em formato brasileiro
+                    # convertidos por convert_locale_numeric.
+                    df = pd.read_csv(file.file, engine='pyarrow', dtype=str)
+                    convert_locale_numeric(df)
+                except (ImportError, ValueError):
+                    file.file.seek(0)
+                    df = pd.read_csv(file.file, **READ_OPTIONS)
+            else:
+                df = pd.read_excel(file.file, **READ_OPTIONS)
             required_columns = ['ADDRESS', 'TIV']
             missing_columns = [col for col in required_columns if col not in df.columns]
-            
+
             if missing_columns:
                 raise HTTPException(
-                    status_code=400, 
+                    status_code=400,
                     detail=f"Colunas obrigatórias ausentes: {', '.join(missing_columns)}"
                 )
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Erro ao ler arquivo: {str(e)}")
-        
-        report_paths = await process_hand_report(input_path)
+
+        report_paths = await process_hand_report(input_path, df=df)
         
         response = {
             "message": "Processamento concluído com sucesso",
@@ -55,6 +74,8 @@ async def upload_hand_file(file: UploadFile = File(...)):
         }
         
         return response
-    
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erro no processamento: {str(e)}")
\ No newline at end of file
@@ -1,18 +1,21 @@
 # src/services/hand_processor.py
 import os
 import asyncio
-from typing import Dict, List
+from functools import partial
+from typing import Dict
 
 from hand_application import HandCalculator
 from hand_report import HandReportGenerator
 
-async def process_hand_report(input_path: str) -> Dict[str, str]:
+async def process_hand_report(input_path: str, df=None) -> Dict[str, str]:
     """
     Processa o arquivo de entrada gerando relatório HAND de forma assíncrona
-    
+
     Args:
         input_path (str): Caminho do arquivo de entrada
-    
+        df (pd.DataFrame, opcional): DataFrame já carregado pelo chamador; quando
+            fornecido, evita a releitura de input_path do disco
+
     Returns:
         Dict[str, str]: Caminhos dos arquivos gerados
     """
@@ -29,21 +32,22 @@ async def process_hand_report(input_path: str) -> Dict[str, str]:
     
     # Processamento do modelo HAND
     loop = asyncio.get_event_loop()
-    
-    # Executar métodos síncronos em um executor para não bloquear
-    calculator = await loop.run_in_executor(None, HandCalculator, "ee-irc")
-    
+
+    # Instância própria da requisição: o estado interno (_df, _features) não é
+    # compartilhado entre uploads concorrentes e a inicialização do Earth Engine
+    # já é amortizada globalmente por ensure_ee_initialized.
+    calculator = HandCalculator("ee-irc")
+
     output_csv_path = os.path.join(temp_dir, f"{unique_id}_processed.csv")
-    
+
     # Executar o processamento usando run_in_executor
-    await loop.run_in_executor(
-        None, 
-        calculator.run, 
-        input_path, 
-        "ADDRESS", 
-        output_csv_path, 
-        True
-    )
+    try:
+        await loop.run_in_executor(
+            None,
+            partial(calculator.run, input_path, "ADDRESS", output_csv_path, df=df)
+        )
+    finally:
+        await loop.run_in_executor(None, calculator.close)
     
     # Geração do relatório
     report_generator = await loop.run_in_executor(